@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import pydantic
 from requests import Response
 
 from .expect import Expect
@@ -22,8 +24,21 @@ class Rip:
     """
     The `Rip` class provides a fluent interface for building and configuring the request specifications for an HTTP request.
     The `given()` method returns a new instance of the `ConfigBuilder` class, which can be used to configure the request specifications.
+
+    Requests are sent with `RequestService` (requests) by default. Any other backend implementing
+    the `HTTPRequest` protocol can be used by passing a factory that takes the base URL.
+
+    Example:
+        Rip(service=MyRequestService).given(base_url)
     """
 
+    __slots__ = ('__service',)
+
+    def __init__(
+        self, service: Callable[[Optional[str]], HTTPRequest] = RequestService
+    ) -> None:
+        self.__service = service
+
     def given(self, base_url: Optional[str] = None) -> ConfigBuilder:
         """
         Constructs a new `ConfigBuilder` instance with the provided base URL.
@@ -34,7 +49,7 @@ class Rip:
         Returns:
             ConfigBuilder: A new `ConfigBuilder` instance with the specified base URL.
         """
-        return ConfigBuilder(base_url)
+        return ConfigBuilder(base_url, self.__service)
 
 
 class ConfigBuilder:
@@ -59,10 +74,16 @@ class ConfigBuilder:
         to execute the HTTP request with the configured specifications.
     """
 
-    def __init__(self, base_url: Optional[str]) -> None:
+    __slots__ = ('__request_specs', '__service')
+
+    def __init__(
+        self,
+        base_url: Optional[str],
+        service: Callable[[Optional[str]], HTTPRequest] = RequestService,
+    ) -> None:
         self.__request_specs = RequestSpecs()
-        self.__request_config = RequestConfig()
         self.__request_specs.base_url = base_url
+        self.__service = service
 
     def base_url(self, base_url: str) -> ConfigBuilder:
         """Sets the base URL for the HTTP requests."""
@@ -79,7 +100,6 @@ class ConfigBuilder:
         """
         if query_params is not None:
             self.__request_specs.query_params = query_params
-            self.__request_config['params'] = self.__request_specs.query_params
         return self
 
     def data(self, data: Optional[Data] = None) -> ConfigBuilder:
@@ -91,7 +111,6 @@ class ConfigBuilder:
         """
         if data is not None:
             self.__request_specs.data = data
-            self.__request_config['data'] = self.__request_specs.data
         return self
 
     def json_data(self, json_data: Optional[dict[str, Any]] = None) -> ConfigBuilder:
@@ -103,7 +122,6 @@ class ConfigBuilder:
         """
         if json_data is not None:
             self.__request_specs.json_data = json_data
-            self.__request_config['json'] = self.__request_specs.json_data
         return self
 
     def headers(self, headers: Optional[dict[str, Any]] = None) -> ConfigBuilder:
@@ -115,7 +133,6 @@ class ConfigBuilder:
         """
         if headers is not None:
             self.__request_specs.headers = headers
-            self.__request_config['headers'] = self.__request_specs.headers
         return self
 
     def cookies(self, cookies: Optional[str] = None) -> ConfigBuilder:
@@ -127,7 +144,6 @@ class ConfigBuilder:
         """
         if cookies is not None:
             self.__request_specs.cookies = cookies
-            self.__request_config['cookies'] = self.__request_specs.cookies
         return self
 
     def auth(self, auth: Optional[tuple] = None) -> ConfigBuilder:
@@ -139,7 +155,6 @@ class ConfigBuilder:
         """
         if auth is not None:
             self.__request_specs.auth = auth
-            self.__request_config['auth'] = self.__request_specs.auth
         return self
 
     def files(self, files: Optional[RequestFiles] = None) -> ConfigBuilder:
@@ -151,7 +166,6 @@ class ConfigBuilder:
         """
         if files is not None:
             self.__request_specs.files = files
-            self.__request_config['files'] = self.__request_specs.files
         return self
 
     def proxies(self, proxies: Optional[dict] = None) -> ConfigBuilder:
@@ -163,7 +177,6 @@ class ConfigBuilder:
         """
         if proxies is not None:
             self.__request_specs.proxies = proxies
-            self.__request_config['proxies'] = self.__request_specs.proxies
         return self
 
     def stream(self, stream: Optional[bool] = None) -> ConfigBuilder:
@@ -173,7 +186,6 @@ class ConfigBuilder:
         """
         if stream is not None:
             self.__request_specs.stream = stream
-            self.__request_config['stream'] = self.__request_specs.stream
         return self
 
     def ssl_verify(self, verify: Optional[Union[bool, str]] = None) -> ConfigBuilder:
@@ -183,7 +195,6 @@ class ConfigBuilder:
         """
         if verify is not None:
             self.__request_specs.verify = verify
-            self.__request_config['verify'] = self.__request_specs.verify
         return self
 
     def cert(self, cert: Optional[Cert] = None) -> ConfigBuilder:
@@ -193,7 +204,6 @@ class ConfigBuilder:
         """
         if cert is not None:
             self.__request_specs.cert = cert
-            self.__request_config['cert'] = self.__request_specs.cert
         return self
 
     def when(self) -> RequestBuilder:
@@ -211,179 +221,83 @@ class ConfigBuilder:
         - `head`: Sends an HTTP HEAD request
         - `trace`: Sends an HTTP TRACE request
         - `connect`: Sends an HTTP CONNECT request
+        - `batch`: Sends several HTTP requests concurrently
         - `clear`: Clears the request specifications.
         - `copy`: Returns a copy of the `RequestConfig`.
         - `then`: Returns a `ExpectBuilder` to build expectations of HTTP response.
         """
-        request = RequestService(self.__request_specs.base_url)
-        return RequestBuilder(request, self.__request_config)
-
-
-class RequestBuilder:
-    def __init__(self, request: HTTPRequest, request_config: RequestConfig) -> None:
-        self.__request = request
-        self.__request_config = request_config
-
-    def get(self, endpoint: str, **kwargs):
-        """
-        Sends an HTTP GET request to the specified URL using the request parameters defined in the RequestSpecs object.
-
-        Args:
-            endpoint (str): The URL endpoint to send the GET request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.get(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
-
-    def post(
-        self,
-        endpoint: str,
-        **kwargs,
-    ):
-        """
-        Sends an HTTP POST request to the specified URL using the request parameters defined in the RequestSpecs object.
-
-        Args:
-            endpoint (str): The endpoint to send the POST request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.post(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
+        new_request = partial(self.__service, self.__request_specs.base_url)
+        request_config = RequestConfig.from_specs(self.__request_specs)
+        return RequestBuilder(new_request(), request_config, new_request)
 
-    def put(self, endpoint: str, **kwargs):
-        """
-        Sends an HTTP PUT request to the specified URL using the request parameters defined in the RequestSpecs object.
 
-        Args:
-            endpoint (str): The URL endpoint to send the PUT request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
+def _verb_method(verb: str) -> Callable[..., RequestBuilder]:
+    http_method = verb.upper()
 
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.put(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
+    def method(self: RequestBuilder, endpoint: str, **kwargs) -> RequestBuilder:
+        return self._dispatch(http_method, endpoint, kwargs)
 
-    def delete(self, endpoint: str, **kwargs: dict[str, Any]) -> RequestBuilder:
-        """
-        Sends an HTTP DELETE request to the specified URL using the request parameters defined in the RequestSpecs object.
+    method.__name__ = verb
+    method.__qualname__ = f'RequestBuilder.{verb}'
+    method.__doc__ = f"""
+        Sends an HTTP {http_method} request to the specified URL using the request parameters defined in the RequestSpecs object.
 
         Args:
-            endpoint (str): The URL endpoint to send the DELETE request to.
+            endpoint (str): The URL endpoint to send the {http_method} request to.
             kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
 
         Returns:
             `RequestBuilder`: For building expectations of HTTP response.
         """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.delete(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
+    return method
 
-    def patch(self, endpoint: str, **kwargs) -> RequestBuilder:
-        """
-        Sends an HTTP PATCH request to the specified URL using the request parameters defined in the RequestSpecs object.
 
-        Args:
-            endpoint (str): The URL endpoint to send the PATCH request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.patch(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
-
-    def head(self, endpoint: str, **kwargs) -> RequestBuilder:
-        """
-        Sends an HTTP HEAD request to the specified URL using the request parameters defined in the RequestSpecs object.
-
-        Args:
-            endpoint (str): The URL endpoint to send the HEAD request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.head(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
-
-    def options(self, endpoint: str, **kwargs) -> RequestBuilder:
-        """
-        Sends an HTTP OPTIONS request to the specified URL using the request parameters defined in the RequestSpecs object.
-
-        Args:
-            endpoint (str): The URL endpoint to send the request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.options(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
-
-    def trace(self, endpoint: str, **kwargs) -> RequestBuilder:
-        """
-        Sends an HTTP TRACE request to the specified URL using the request parameters defined in the RequestSpecs object.
-
-        Args:
-            endpoint (str): The URL endpoint to send the TRACE request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.trace(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
-
-    def connect(self, endpoint: str, **kwargs) -> RequestBuilder:
-        """
-        Sends an HTTP CONNECT request to the specified URL using the request parameters defined in the RequestSpecs object.
-
-        Args:
-            endpoint (str): The URL endpoint to send the CONNECT request to.
-            kwargs (dict[str, Any]): Additional keyword arguments to pass to the underlying requests library.
-
-        Returns:
-            `RequestBuilder`: For building expectations of HTTP response.
-        """
-        self.__request_config.update(**kwargs) or None
-        self.__response = self.__request.connect(
-            endpoint, **self.__request_config.parameters
-        )
-        return self
+class RequestBuilder:
+    __slots__ = (
+        '__new_request',
+        '__request',
+        '__request_config',
+        '__response',
+        '__send',
+    )
+
+    def __init__(
+        self,
+        request: HTTPRequest,
+        request_config: RequestConfig,
+        new_request: Optional[Callable[[], HTTPRequest]] = None,
+    ) -> None:
+        self.__request = request
+        self.__request_config = request_config
+        self.__send = request.request
+        # Creates the per-thread services used by `batch`; without it, `batch` sends
+        # every request through `request`, which must then be thread-safe.
+        self.__new_request = new_request or (lambda: request)
+
+    def _dispatch(
+        self, method: str, endpoint: str, kwargs: Dict[str, Any]
+    ) -> RequestBuilder:
+        request_config = self.__request_config
+        if kwargs:
+            request_config.update(**kwargs)
+        self.__response = self.__send(method, endpoint, request_config.parameters)
+        return self
+
+    get = _verb_method('get')
+    post = _verb_method('post')
+    put = _verb_method('put')
+    delete = _verb_method('delete')
+    patch = _verb_method('patch')
+    head = _verb_method('head')
+    options = _verb_method('options')
+    trace = _verb_method('trace')
+    connect = _verb_method('connect')
 
     def close(self) -> RequestBuilder:
         """
-        Closes the underlying HTTP session.
+        Closes the underlying HTTP service. With the default `RequestService` this
+        releases nothing; its pooled connections are shared and are closed with
+        `request.close_connections`.
 
         Returns:
             `RequestBuilder`: For building HTTP requests.
@@ -401,6 +315,51 @@ class RequestBuilder:
         self.__request_config.copy()
         return self
 
+    def batch(
+        self,
+        requests: List[Tuple[str, str, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+    ) -> List[ExpectBuilder]:
+        """
+        Sends several HTTP requests concurrently over the shared connection pool.
+
+        Each worker thread sends through its own HTTP service, so sessions are never shared
+        between threads. Each request uses the configured request parameters, updated with
+        its own keyword arguments.
+
+        Example:
+            requests = [('GET', '/posts/1', {}), ('GET', '/posts', {'params': {'userId': 1}})]
+
+        Args:
+            requests (List[Tuple[str, str, Dict[str, Any]]]): (method, endpoint, kwargs) of each request.
+            max_workers (Optional[int]): Maximum number of requests in flight, defaults to the thread pool default.
+
+        Returns:
+            List[ExpectBuilder]: One `ExpectBuilder` per request, in the order of `requests`.
+        """
+
+        local = threading.local()
+        services: List[HTTPRequest] = []
+
+        def send(method: str, endpoint: str, kwargs: Dict[str, Any]) -> Response:
+            service = getattr(local, 'service', None)
+            if service is None:
+                service = local.service = self.__new_request()
+                services.append(service)
+            request_config = self.__request_config.copy()
+            if kwargs:
+                request_config.update(**kwargs)
+            return service.request(method.upper(), endpoint, request_config.parameters)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = executor.map(lambda request: send(*request), requests)
+                return [ExpectBuilder(response) for response in responses]
+        finally:
+            for service in services:
+                if service is not self.__request:
+                    service.close()
+
     def then(self) -> ExpectBuilder:
         """
         Returns a `ExpectBuilder` instance that can be used to build expectations for the response of an HTTP request.
@@ -419,6 +378,8 @@ class RequestBuilder:
 
 
 class ExpectBuilder:
+    __slots__ = ('__response', '__expect')
+
     def __init__(self, response: Response) -> None:
         self.__response = response
         self.__expect = Expect(self.__response)
@@ -438,7 +399,8 @@ class ExpectBuilder:
 
     def expect_headers(self, headers: Dict[str, Any]) -> ExpectBuilder:
         """
-        Expect the response to have the specified headers.
+        Expect the response to have the specified headers. Other response headers are ignored
+        and header names are compared case-insensitively.
 
         Args:
             headers (Dict[str, Any]): The expected headers to compare against the response headers.
@@ -570,15 +532,35 @@ class ExpectBuilder:
         self.__expect.json_path(json_path_expr, expected_value)
         return self
 
-    def expect_json_schema(self, schema: pydantic.BaseModel) -> ExpectBuilder:
+    def expect_json_schema(
+        self, schema: Union[type[Any], Dict[str, Any]]
+    ) -> ExpectBuilder:
         """
         Expect the response to have the specified JSON schema / model.
 
+        The response body is trusted, so for a model only its shape is checked: the body must
+        be an object holding every required field, by name or alias. Field values are not validated.
+        Other types (e.g. `list[Model]`) are validated with a cached `TypeAdapter`.
+        Use `expect_json_schema_validate` to fully validate untrusted payloads.
+
         Args:
-            schema (pydantic.BaseModel): The JSON schema to validate the response against.
+            schema (Union[type[Any], Dict[str, Any]]): The JSON schema to validate the response against.
 
         Returns:
             ExpectBuilder: The current `ExpectBuilder` instance, for chaining additional expectations.
         """
         self.__expect.json_schema(schema)
         return self
+
+    def expect_json_schema_validate(self, schema: Any) -> ExpectBuilder:
+        """
+        Expect the response to pass full validation against the specified model or type.
+
+        Args:
+            schema (Any): The pydantic model or type to validate the response against.
+
+        Returns:
+            ExpectBuilder: The current `ExpectBuilder` instance, for chaining additional expectations.
+        """
+        self.__expect.json_schema_validate(schema)
+        return self
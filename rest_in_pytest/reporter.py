@@ -5,15 +5,18 @@ import os
 from jinja2 import Environment, FileSystemLoader
 from pytest_html import HTMLReporter
 
+# Shared by all reporters so templates are compiled once per process.
+_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
+    auto_reload=False,
+    cache_size=-1,
+)
+
 
 class Reporter(HTMLReporter):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.template_env = Environment(
-            loader=FileSystemLoader(
-                os.path.join(os.path.dirname(__file__), 'templates')
-            )
-        )
-        self.template = self.env.get_template('report.html')
+        self.template_env = _ENV
+        self.template = self.template_env.get_template('report.html')
 
     # TODO Generate report with custom styling
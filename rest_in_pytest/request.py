@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import json
-from http import HTTPMethod
-from typing import Any, Protocol
-from urllib.parse import urljoin
+import logging
+import threading
+from typing import Any, Callable, Mapping, Optional, Protocol
+from urllib.parse import urljoin, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3 import Retry
 
 from .error import Error
 from .logger import logger
 
 
 class HTTPRequest(Protocol):
+    def request(
+        self, method: str, endpoint: str, options: Mapping[str, Any]
+    ) -> requests.Response: ...
     def get(self, endpoint: str, **kwargs) -> requests.Response: ...
     def post(self, endpoint: str, **kwargs) -> requests.Response: ...
     def put(self, endpoint: str, **kwargs) -> requests.Response: ...
@@ -25,57 +31,138 @@ class HTTPRequest(Protocol):
     def close(self) -> None: ...
 
 
-class RequestService:
-    def __init__(self, base_url) -> None:
-        self._base_url = base_url
-        self._session = requests.Session()
+# Connection pools shared by every RequestService, keyed by pool sizing.
+# Each adapter's PoolManager keeps one pool per (scheme, host, port), so services
+# talking to the same origin reuse its keep-alive connections. Reusing those
+# connections is what saves TLS handshakes: urllib3 does not expose the `ssl`
+# module's client-side session reuse, so a dropped connection does a full one.
+_ADAPTER_CACHE: dict[tuple[int, int], HTTPAdapter] = {}
+_ADAPTER_LOCK = threading.Lock()
+
+
+def _shared_http_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    key = (pool_connections, pool_maxsize)
+    with _ADAPTER_LOCK:
+        adapter = _ADAPTER_CACHE.get(key)
+        if adapter is None:
+            # Only connection failures are retried: a retried status code, including a
+            # 413, 429 or 503 with Retry-After, would hide or replay the response
+            # the test is asserting on.
+            retries = Retry(
+                total=3,
+                connect=3,
+                read=0,
+                status=0,
+                redirect=0,
+                other=0,
+                respect_retry_after_header=False,
+                backoff_factor=0.1,
+            )
+            adapter = _ADAPTER_CACHE[key] = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=retries,
+            )
+        return adapter
 
-    def get(self, endpoint: str, **kwargs) -> requests.Response:
-        return self._request(method=HTTPMethod.GET, endpoint=endpoint, **kwargs)
 
-    def post(
-        self,
-        endpoint: str,
-        **kwargs,
-    ) -> requests.Response:
-        return self._request(method=HTTPMethod.POST, endpoint=endpoint, **kwargs)
+def close_connections() -> None:
+    """Closes the connection pools shared by all `RequestService` instances."""
+    with _ADAPTER_LOCK:
+        for adapter in _ADAPTER_CACHE.values():
+            adapter.close()
+        _ADAPTER_CACHE.clear()
 
-    def put(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.PUT, endpoint=endpoint, **kwargs)
 
-    def delete(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.DELETE, endpoint=endpoint, **kwargs)
+def _origin(base_url: Optional[str]) -> Optional[str]:
+    """Returns 'scheme://netloc' when `base_url` has no path, query or fragment."""
+    if not base_url:
+        return None
+    parts = urlsplit(base_url)
+    if not (parts.scheme and parts.netloc) or parts.query or parts.fragment:
+        return None
+    if parts.path not in ('', '/'):
+        return None
+    return f'{parts.scheme}://{parts.netloc}'
 
-    def patch(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.PATCH, endpoint=endpoint, **kwargs)
 
-    def head(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.HEAD, endpoint=endpoint, **kwargs)
+def _verb(method: str) -> Callable[..., requests.Response]:
+    def send(self: RequestService, endpoint: str, **kwargs) -> requests.Response:
+        return self.request(method, endpoint, kwargs)
 
-    def options(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.OPTIONS, endpoint=endpoint, **kwargs)
+    send.__name__ = method.lower()
+    send.__qualname__ = f'RequestService.{send.__name__}'
+    return send
 
-    def connect(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.CONNECT, endpoint=endpoint, **kwargs)
 
-    def trace(self, endpoint: str, **kwargs):
-        return self._request(method=HTTPMethod.TRACE, endpoint=endpoint, **kwargs)
+class RequestService:
+    def __init__(
+        self, base_url, pool_connections: int = 50, pool_maxsize: int = 100
+    ) -> None:
+        self._base_url = base_url
+        self._origin = _origin(base_url)
+        self._url_cache: dict[str, str] = {}
+        # Sessions stay per service so cookies don't leak between tests,
+        # while the connection pools behind them are shared.
+        self._session = requests.Session()
+        adapter = _shared_http_adapter(pool_connections, pool_maxsize)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._send = self._session.request
+
+    def _request(self, method: str, /, endpoint: str, **kwargs) -> requests.Response:
+        return self.request(method, endpoint, kwargs)
+
+    get = _verb('GET')
+    post = _verb('POST')
+    put = _verb('PUT')
+    delete = _verb('DELETE')
+    patch = _verb('PATCH')
+    head = _verb('HEAD')
+    options = _verb('OPTIONS')
+    connect = _verb('CONNECT')
+    trace = _verb('TRACE')
 
     def close(self):
-        self._session.close()
+        """Does not release anything: connections live in the shared pools, which
+        stay open until `close_connections` is called."""
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        url = urljoin(self._base_url, endpoint)
-        logger.info(f'Request: {method} {url} \nkwargs: {kwargs}')
+    def request(
+        self, method: str, endpoint: str, options: Mapping[str, Any]
+    ) -> requests.Response:
+        """Sends a request, passing `options` as keyword arguments to `requests`."""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self._join(endpoint)
+        logger.info('Request: %s %s \nkwargs: %s', method, url, options)
+        # Requests are prepared on every call rather than cloned from a cached
+        # PreparedRequest: the session's cookie jar changes between responses, auth
+        # handlers register per-request hooks, and file or stream bodies are consumed.
         try:
-            response = self._session.request(method=method, url=url, **kwargs)
-            if not self._status_code_is_success(response):
-                logger.debug(
-                    f'Response text: {response.text}, Status code: {response.status_code}'
-                )
-            return response
+            response = self._send(method, url, **options)
         except RequestException as e:
-            raise Error(f'Request Error: {e}')
+            raise Error(f'Request Error: {e}') from e
+        status_code = response.status_code
+        # response.text decodes the body, so only touch it when DEBUG is on
+        if not 200 <= status_code <= 299 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Response text: %s, Status code: %s', response.text, status_code
+            )
+        return response
+
+    def _join(self, endpoint: str) -> str:
+        """Joins `endpoint` to the base URL, like `urljoin` but without parsing in the common cases."""
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
+        # A root-relative path without dot segments replaces the base URL's path
+        if (
+            self._origin is not None
+            and endpoint.startswith('/')
+            and not endpoint.startswith('//')
+            and '/.' not in endpoint
+        ):
+            return self._origin + endpoint
+        return urljoin(self._base_url, endpoint)
 
     def _handle_data(self, **kwargs) -> dict[str, Any]:
         # At least one argument must be provided
@@ -88,6 +175,3 @@ class RequestService:
             if isinstance(kwargs['data'], dict):
                 kwargs['data'] = json.dumps(kwargs['data'])
         return kwargs
-
-    def _status_code_is_success(self, response: requests.Response) -> bool:
-        return 200 <= response.status_code <= 299
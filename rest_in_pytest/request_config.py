@@ -1,6 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Iterator, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    from .request_specs import RequestSpecs
+
+# (RequestSpecs attribute, requests keyword argument)
+_SPEC_PARAMETERS = (
+    ('query_params', 'params'),
+    ('data', 'data'),
+    ('json_data', 'json'),
+    ('headers', 'headers'),
+    ('cookies', 'cookies'),
+    ('auth', 'auth'),
+    ('files', 'files'),
+    ('proxies', 'proxies'),
+    ('stream', 'stream'),
+    ('verify', 'verify'),
+    ('cert', 'cert'),
+)
 
 
 class RequestConfig:
@@ -11,9 +29,23 @@ class RequestConfig:
     It allows you to update the parameters in a convenient way, and provides an iterator to access the parameters.
     """
 
+    # Value types accepted by `update`
+    _ALLOWED_TYPES = (str, int, float, dict, list)
+
     def __init__(self) -> None:
         self.parameters: dict[str, Any] = {}
 
+    @classmethod
+    def from_specs(cls, specs: RequestSpecs) -> 'RequestConfig':
+        """Creates a `RequestConfig` from the request specifications that have been set."""
+        config = cls()
+        config.parameters = {
+            key: value
+            for attr, key in _SPEC_PARAMETERS
+            if (value := getattr(specs, attr)) is not None
+        }
+        return config
+
     def __str__(self) -> str:
         return f'RequestConfig with parameters: {self.parameters}'
 
@@ -21,7 +53,10 @@ class RequestConfig:
         return f'RequestConfig({vars(self)})'
 
     def __iter__(self) -> Iterator[tuple[str, Any]]:
-        return iter(vars(self).items())
+        return iter(self.parameters.items())
+
+    def __len__(self) -> int:
+        return len(self.parameters)
 
     def __getitem__(self, key: str) -> Any:
         return self.parameters[key]
@@ -42,15 +77,13 @@ class RequestConfig:
             **kwargs: Optional dictionary, bytes, string, tuple, boolean, or list values to update the parameters with.
 
         Raises:
-            ValueError: If any of the keys in the kwargs are not strings, or if any of the values are not strings, numbers, or dictionaries.
+            ValueError: If any of the values are not strings, numbers, dictionaries or lists.
         """
+        # Keyword argument names are always strings, so only values are checked
+        allowed_types = self._ALLOWED_TYPES
         for k, v in kwargs.items():
-            if not isinstance(k, str):
-                raise ValueError(f'Key {k} must be a string')
-            if v is not None and not isinstance(v, (str, int, float, dict, list)):
-                raise ValueError(
-                    f'Key {k} must be a string and value must be a string, number or dict'
-                )
+            if v is not None and not isinstance(v, allowed_types):
+                raise ValueError(f'Value of {k} must be a string, number, dict or list')
 
             self.parameters[k] = v
 
@@ -58,6 +91,7 @@ class RequestConfig:
         self.parameters.clear()
 
     def copy(self) -> 'RequestConfig':
-        new_config = RequestConfig()
-        new_config.parameters.update(self.parameters)
+        # Skip __init__, whose empty dict would be replaced straight away
+        new_config = RequestConfig.__new__(RequestConfig)
+        new_config.parameters = self.parameters.copy()
         return new_config
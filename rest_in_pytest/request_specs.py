@@ -30,116 +30,35 @@ class RequestSpecs:
         `json_data`: The JSON data to be included in the request body.
     """
 
+    __slots__ = (
+        'base_url',
+        'query_params',
+        'data',
+        'headers',
+        'cookies',
+        'files',
+        'auth',
+        'stream',
+        'proxies',
+        'verify',
+        'cert',
+        'json_data',
+    )
+
     def __init__(self) -> None:
-        self._base_url = None
-        self._query_params = None
-        self._data = None
-        self._headers = None
-        self._cookies = None
-        self._files = None
-        self._auth = None
+        self.base_url: Optional[str] = None
+        self.query_params: Optional[QueryParams] = None
+        self.data: Optional[Data] = None
+        self.headers: Optional[dict[str, Any]] = None
+        self.cookies: Optional[str] = None
+        self.files: Optional[RequestFiles] = None
+        self.auth: Optional[tuple] = None
         # TODO: NotImplemented
-        # self._timout = None,
-        # self._allow_redirects=True,
-        # self.hooks=None,
-        self._stream = None
-        self._proxies = None
-        self._verify = None
-        self._cert = None
-        self._json_data = None
-
-    @property
-    def base_url(self):
-        return self._base_url
-
-    @base_url.setter
-    def base_url(self, url) -> None:
-        self._base_url = url
-
-    @property
-    def query_params(self) -> Optional[QueryParams]:
-        return self._query_params
-
-    @query_params.setter
-    def query_params(self, query_params) -> None:
-        self._query_params = query_params
-
-    @property
-    def data(self) -> Optional[Data]:
-        return self._data
-
-    @data.setter
-    def data(self, data) -> None:
-        self._data = data
-
-    @property
-    def headers(self) -> Optional[dict[str, Any]]:
-        return self._headers
-
-    @headers.setter
-    def headers(self, headers) -> None:
-        self._headers = headers
-
-    @property
-    def cookies(self) -> Optional[str]:
-        return self._cookies
-
-    @cookies.setter
-    def cookies(self, cookies) -> None:
-        self._cookies = cookies
-
-    @property
-    def verify(self) -> Optional[Union[bool, str]]:
-        return self._verify
-
-    @verify.setter
-    def verify(self, verify) -> None:
-        self._verify = verify
-
-    @property
-    def auth(self) -> Optional[tuple]:
-        return self._auth
-
-    @auth.setter
-    def auth(self, auth) -> None:
-        self._auth = auth
-
-    @property
-    def files(self) -> Optional[RequestFiles]:
-        return self._files
-
-    @files.setter
-    def files(self, files) -> None:
-        self._files = files
-
-    @property
-    def proxies(self) -> Optional[dict]:
-        return self._proxies
-
-    @proxies.setter
-    def proxies(self, proxies) -> None:
-        self._proxies = proxies
-
-    @property
-    def stream(self) -> Optional[bool]:
-        return self._stream
-
-    @stream.setter
-    def stream(self, stream):
-        self._stream = stream
-
-    @property
-    def cert(self) -> Optional[Cert]:
-        return self._cert
-
-    @cert.setter
-    def cert(self, cert):
-        self._cert = cert
-
-    @property
-    def json_data(self) -> Optional[dict[str, Any]]:
-        return self._json_data
-
-    @json_data.setter
-    def json_data(self, json_data):
-        self._json_data = json_data
+        # self.timeout = None,
+        # self.allow_redirects = True,
+        # self.hooks = None,
+        self.stream: Optional[bool] = None
+        self.proxies: Optional[dict] = None
+        self.verify: Optional[Union[bool, str]] = None
+        self.cert: Optional[Cert] = None
+        self.json_data: Optional[dict[str, Any]] = None
@@ -1,6 +1,14 @@
 import pytest
 
+from rest_in_pytest.request import close_connections
+
 
 @pytest.fixture(scope='module')
 def base_url():
     return 'https://jsonplaceholder.typicode.com'
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _close_connections():
+    yield
+    close_connections()
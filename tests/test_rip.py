@@ -1,6 +1,20 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pydantic
 import pytest
+import requests
 
 from rest_in_pytest import Rip
+from rest_in_pytest.builder import ExpectBuilder
+from rest_in_pytest.request import RequestService
+
+
+class Post(pydantic.BaseModel):
+    userId: int
+    id: int
+    title: str
+    body: str
 
 
 # GET test
@@ -17,6 +31,7 @@ def test_get_resource(base_url):
         .then()
         .expect_status(200)
         .expect_header_content_type('application/json; charset=utf-8')
+        .expect_headers({'content-type': 'application/json; charset=utf-8'})
         .expect_json_path('$.userId', 'userId')
         .expect_json_contains(
             {
@@ -168,5 +183,199 @@ def test_specs(base_url, path_params):
     )
 
 
+# JSON path test
+@pytest.mark.parametrize('user_id', [1, 2])
+def test_json_path(base_url, user_id):
+    (
+        Rip()
+        .given(base_url)
+        .params({'userId': user_id})
+        .when()
+        .get('/posts')
+        .then()
+        .expect_status(200)
+        .expect_json_path('$[*].userId', user_id)
+    )
+
+
+# Failed expectation test
+@pytest.mark.parametrize(
+    'endpoint, expect',
+    [
+        ('/posts/1', lambda e: e.expect_status(404)),
+        ('/posts/1', lambda e: e.expect_headers({'Content-Type': 'text/html'})),
+        ('/posts/1', lambda e: e.expect_key('missing')),
+        ('/posts/1', lambda e: e.expect_key_value('id', 2)),
+        ('/posts', lambda e: e.expect_key_value('id', 1)),
+        ('/posts/1', lambda e: e.expect_json_path('$.userId', 2)),
+    ],
+)
+@pytest.mark.parametrize('detailed', [False, True])
+def test_expect_failure(base_url, monkeypatch, endpoint, expect, detailed):
+    monkeypatch.setattr('rest_in_pytest.expect._DETAILED_ASSERTS', detailed)
+    then = Rip().given(base_url).when().get(endpoint).then()
+    with pytest.raises(AssertionError):
+        expect(then)
+
+
+# JSON charset test
+# The body is decoded with the declared charset
+@pytest.mark.parametrize('charset', ['utf-8', 'latin-1', 'utf-16'])
+def test_json_charset(charset):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = f'application/json; charset={charset}'
+    response.encoding = charset
+    response._content = '{"title": "café"}'.encode(charset)
+    ExpectBuilder(response).expect_key_value('title', 'café')
+
+
+# JSON schema test
+def test_json_schema(base_url):
+    (
+        Rip()
+        .given(base_url)
+        .when()
+        .get('/posts/1')
+        .then()
+        .expect_status(200)
+        .expect_json_schema(Post)
+        .expect_json_schema_validate(Post)
+    )
+
+
+class PostWithAuthor(Post):
+    author: str
+
+
+@pytest.mark.parametrize(
+    'endpoint, schema',
+    [
+        # A list body is not an object
+        ('/posts', Post),
+        # A required field is missing
+        ('/posts/1', PostWithAuthor),
+    ],
+)
+def test_json_schema_mismatch(base_url, endpoint, schema):
+    expect = Rip().given(base_url).when().get(endpoint).then()
+    with pytest.raises(AssertionError):
+        expect.expect_json_schema(schema)
+
+
+@pytest.mark.parametrize(
+    'method', ['expect_json_schema', 'expect_json_schema_validate']
+)
+@pytest.mark.parametrize(
+    'endpoint, schema',
+    [
+        ('/posts/1', list[Post]),
+        ('/posts', Post),
+        ('/posts/1', PostWithAuthor),
+    ],
+)
+def test_json_schema_validate_mismatch(base_url, method, endpoint, schema):
+    expect = Rip().given(base_url).when().get(endpoint).then()
+    with pytest.raises(AssertionError):
+        getattr(expect, method)(schema)
+
+
+def test_json_schema_validate_rejects_dict(base_url):
+    expect = Rip().given(base_url).when().get('/posts/1').then()
+    with pytest.raises(TypeError):
+        expect.expect_json_schema_validate({'id': 1})
+
+
+def test_json_schema_list(base_url):
+    (
+        Rip()
+        .given(base_url)
+        .params({'userId': 1})
+        .when()
+        .get('/posts')
+        .then()
+        .expect_status(200)
+        .expect_json_schema(list[Post])
+    )
+
+
+# Batch test
+def test_batch(base_url):
+    expectations = (
+        Rip()
+        .given(base_url)
+        .headers({'Content-Type': 'application/json'})
+        .when()
+        .batch(
+            [
+                ('GET', '/posts/1', {}),
+                ('GET', '/posts', {'params': {'userId': 1}}),
+                ('POST', '/posts', {'json': {'title': 'foo'}}),
+                ('POST', '/posts', {}),
+            ]
+        )
+    )
+    expectations[0].expect_status(200).expect_key_value('id', 1)
+    expectations[1].expect_status(200).expect_json_path('$[*].userId', 1)
+    expectations[2].expect_status(201).expect_key_value('title', 'foo')
+    # Keyword arguments of one request do not leak into the others
+    expectations[3].expect_status(201).expect_json({'id': 101})
+
+
+@pytest.fixture
+def rate_limited_url():
+    hits = []
+
+    class RateLimited(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RateLimited)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}', hits
+    server.shutdown()
+    server.server_close()
+
+
+# Retry policy test
+# A status code is returned as it is, even with Retry-After
+def test_status_not_retried(rate_limited_url):
+    base_url, hits = rate_limited_url
+    Rip().given(base_url).when().get('/ratelimited').then().expect_status(429)
+    assert hits == ['/ratelimited']
+
+
+class RecordingService(RequestService):
+    def __init__(self, base_url, sent):
+        super().__init__(base_url)
+        self.sent = sent
+
+    def request(self, method, endpoint, options):
+        self.sent.append((method, endpoint))
+        return super().request(method, endpoint, options)
+
+
+# Custom HTTP backend test
+def test_custom_service(base_url):
+    sent = []
+    (
+        Rip(service=lambda base_url: RecordingService(base_url, sent))
+        .given(base_url)
+        .when()
+        .get('/posts/1')
+        .then()
+        .expect_status(200)
+    )
+    assert sent == [('GET', '/posts/1')]
+
+
 # TODO: Cover other scenarios
-# TODO: Add other expectations (expect_json_schema, etc)
+# TODO: Add other expectations